@@ -7,7 +7,7 @@ from dotenv import load_dotenv
 
 from src.acqlist import load_leads_from_excel, LeadColumns
 from src.gmail_auth import get_gmail_service
-from src.gmail_send import create_message, render_email_body, subject_from_template, send_one
+from src.gmail_send import create_message, render_email_bodies, subjects_from_template, send_one
 from src.storage import load_suppression, append_send_log
 
 
@@ -50,34 +50,35 @@ def main() -> None:
         print("Geen leads gevonden met geldige email_primary.")
         return
 
-    # 2) suppression
+    # 2) suppression: één vectorized isin-mask i.p.v. een set-lookup per rij in de loop
     suppressed = load_suppression(suppression_path)
+    if suppressed:
+        df = df[~df["email_primary"].isin(suppressed)]
 
     # 3) auth/service (alleen als niet dry-run)
     service = None
     if not dry_run:
         service = get_gmail_service(credentials_json=credentials_json, token_json=token_json)
 
-    # 4) send loop
-    sent_count = 0
-    for _, row in df.iterrows():
-        email = (row.get("email_primary") or "").strip().lower()
-        if not email or "@" not in email:
-            continue
-        if email in suppressed:
-            continue
-
-        subject = subject_from_template(subject_template, row)
-        body = render_email_body(row)
+    # 4) alleen de leads die deze run verwerkt worden; teksten daarvoor in één keer opbouwen
+    df = df.head(max(max_emails, 0))
+    subjects = subjects_from_template(subject_template, df)
+    bodies = render_email_bodies(df)
 
+    # 5) send loop
+    sent_count = 0
+    # Kolomsgewijs itereren: iterrows() bouwt per rij een complete Series
+    rows = zip(df["email_primary"], df["Company"], df["Title"], subjects, bodies)
+    for email, company, title, subject, body in rows:
+        # email_primary is al lowercase, gevalideerd en tegen suppression gefilterd
         if dry_run:
             print(f"[DRY_RUN] Would send to {email} | subject='{subject}'")
             append_send_log(
                 send_log_path,
                 {
                     "email": email,
-                    "company": row.get("Company", ""),
-                    "title": row.get("Title", ""),
+                    "company": company,
+                    "title": title,
                     "status": "DRY_RUN",
                     "message_id": "",
                     "error": "",
@@ -91,8 +92,8 @@ def main() -> None:
                     send_log_path,
                     {
                         "email": email,
-                        "company": row.get("Company", ""),
-                        "title": row.get("Title", ""),
+                        "company": company,
+                        "title": title,
                         "status": "SENT",
                         "message_id": message_id,
                         "error": "",
@@ -103,8 +104,8 @@ def main() -> None:
                     send_log_path,
                     {
                         "email": email,
-                        "company": row.get("Company", ""),
-                        "title": row.get("Title", ""),
+                        "company": company,
+                        "title": title,
                         "status": "ERROR",
                         "message_id": "",
                         "error": str(e),
@@ -112,8 +113,6 @@ def main() -> None:
                 )
 
         sent_count += 1
-        if sent_count >= max_emails:
-            break
 
     print(f"Klaar. Verwerkt: {sent_count} (dry_run={dry_run}). Log: {send_log_path}")
 
@@ -25,6 +25,8 @@ def _extract_emails(value: object) -> list[str]:
     if value is None:
         return []
     text = str(value)
+    if "@" not in text:  # snelle check; bespaart de regex-scan op lege/ongeldige cellen
+        return []
     return list(dict.fromkeys(EMAIL_RE.findall(text)))  # unique behoud volgorde
 
 
@@ -33,26 +35,34 @@ def load_leads_from_excel(
     sheet_name: Optional[str] = None,
     columns: LeadColumns = LeadColumns(),
 ) -> pd.DataFrame:
-    df = pd.read_excel(xlsx_path, sheet_name=sheet_name, engine="openpyxl")
+    lead_cols = (columns.first_name, columns.last_name, columns.company, columns.title, columns.email, columns.website)
+
+    # Alleen de kolommen inlezen die we gebruiken (scheelt parse-werk en geheugen bij brede sheets).
+    # sheet_name=None zou pandas alle sheets als dict laten teruggeven; dan nemen we de eerste.
+    df = pd.read_excel(
+        xlsx_path,
+        sheet_name=0 if sheet_name is None else sheet_name,
+        engine="openpyxl",
+        usecols=lambda c: c in lead_cols,
+    )
 
     # Zorg dat basis kolommen bestaan; als niet, laat df gewoon door (dan kun je later mappen)
     # Maar we normaliseren alvast.
-    for col in [columns.first_name, columns.last_name, columns.company, columns.title, columns.email, columns.website]:
+    for col in lead_cols:
         if col not in df.columns:
             df[col] = ""
 
     # Email normalisatie: soms staan er meerdere e-mails in één cel.
     df["_emails"] = df[columns.email].apply(_extract_emails)
-    df["email_primary"] = df["_emails"].apply(lambda xs: xs[0] if xs else "")
+    # Regex-matches bevatten geen whitespace, dus lowercasen volstaat (één pass)
+    df["email_primary"] = df["_emails"].apply(lambda xs: xs[0].lower() if xs else "")
 
     # Schone strings
     for col in [columns.first_name, columns.last_name, columns.company, columns.title, columns.website]:
         df[col] = df[col].fillna("").astype(str).str.strip()
 
-    df["email_primary"] = df["email_primary"].fillna("").astype(str).str.strip().str.lower()
-
     # Filter: alleen rijen met een geldig email_primary
-    df = df[df["email_primary"].str.contains("@", na=False)].copy()
+    df = df[df["email_primary"].ne("")].copy()
 
     return df
 
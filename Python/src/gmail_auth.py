@@ -3,11 +3,6 @@ from __future__ import annotations
 import os
 from typing import Sequence
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-
 
 DEFAULT_SCOPES: Sequence[str] = ("https://www.googleapis.com/auth/gmail.send",)
 
@@ -22,9 +17,18 @@ def get_gmail_service(
     - credentials_json: OAuth client secrets file (downloaded from Google Cloud Console)
     - token_json: saved token cache (will be created/updated)
     """
-    creds = None
-    if os.path.exists(token_json):
+    # Lazy imports: de Google client libs zijn traag om te laden en alleen nodig
+    # als we echt gaan versturen (niet bij DRY_RUN).
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from googleapiclient.discovery import build
+
+    # Gewoon proberen te openen i.p.v. eerst exists() (scheelt een stat en een race)
+    try:
         creds = Credentials.from_authorized_user_file(token_json, scopes)
+    except FileNotFoundError:
+        creds = None
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 import base64
+import io
+from email import policy
+from email.generator import BytesGenerator
 from email.message import EmailMessage
 from typing import Any, Dict
 
 import pandas as pd
 
 
+# Vaste afsluiting van elke mail; één keer opgebouwd i.p.v. per rij
+_BODY_CLOSING = "\n".join(
+    [
+        "Heb je deze week 10 minuten voor een korte kennismaking?",
+        "",
+        "Groet,",
+        "Noah",
+    ]
+)
+
+
 def create_message(sender_name: str, to_addr: str, subject: str, body_text: str) -> Dict[str, str]:
-    msg = EmailMessage()
+    # policy.SMTP: regeleinden worden CRLF (RFC 5322) i.p.v. LF zoals bij de default policy;
+    # Gmail accepteert beide, maar de raw bytes die we versturen verschillen daardoor.
+    msg = EmailMessage(policy=policy.SMTP)
     # Let op: Gmail API bepaalt de daadwerkelijke From (account), maar naam kan via headers.
     msg["To"] = to_addr
     msg["Subject"] = subject
@@ -17,34 +33,29 @@ def create_message(sender_name: str, to_addr: str, subject: str, body_text: str)
 
     msg.set_content(body_text)
 
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+    # Direct in een buffer serialiseren en base64 over de memoryview doen (geen extra kopie)
+    buf = io.BytesIO()
+    BytesGenerator(buf).flatten(msg)  # gebruikt msg.policy
+    raw = base64.urlsafe_b64encode(buf.getbuffer()).decode("ascii")
+    buf.close()
     return {"raw": raw}
 
 
-def render_email_body(row: pd.Series) -> str:
-    # Heel basic template; pas aan aan jouw tone of voice
-    first = (row.get("First Name") or "").strip()
-    company = (row.get("Company") or "").strip()
-    title = (row.get("Title") or "").strip()
-
-    greet = f"Hoi {first}," if first else "Hoi,"
-    line2 = f"Ik zag dat je werkzaam bent bij {company}." if company else "Ik kwam je profiel tegen."
-    line3 = f"In jouw rol als {title} leek het me interessant om even kennis te maken." if title else "Het leek me interessant om even kennis te maken."
-
-    return "\n".join(
-        [
-            greet,
-            "",
-            line2,
-            line3,
-            "",
-            "Heb je deze week 10 minuten voor een korte kennismaking?",
-            "",
-            "Groet,",
-            "Noah",
-        ]
+def render_email_bodies(df: pd.DataFrame) -> pd.Series:
+    """Mailtekst voor alle leads in één keer (pandas string ops); pas aan aan jouw tone of voice."""
+    # Kolommen zijn al aanwezig en opgeschoond door load_leads_from_excel
+    first = df["First Name"]
+    company = df["Company"]
+    title = df["Title"]
+
+    greet = ("Hoi " + first + ",").where(first.ne(""), "Hoi,")
+    line2 = ("Ik zag dat je werkzaam bent bij " + company + ".").where(company.ne(""), "Ik kwam je profiel tegen.")
+    line3 = ("In jouw rol als " + title + " leek het me interessant om even kennis te maken.").where(
+        title.ne(""), "Het leek me interessant om even kennis te maken."
     )
 
+    return greet + "\n\n" + line2 + "\n" + line3 + "\n\n" + _BODY_CLOSING
+
 
 def send_one(service: Any, user_id: str, message: Dict[str, str]) -> str:
     """Returns message id."""
@@ -52,7 +63,8 @@ def send_one(service: Any, user_id: str, message: Dict[str, str]) -> str:
     return str(resp.get("id", ""))
 
 
-def subject_from_template(template: str, row: pd.Series) -> str:
-    company = (row.get("Company") or "").strip()
-    # veilige format
-    return template.format(company=company or "jullie")
+def subjects_from_template(template: str, df: pd.DataFrame) -> pd.Series:
+    """Onderwerpregel per lead; template.format per rij zodat format specs/conversies blijven werken."""
+    company = df["Company"]
+    company = company.where(company.ne(""), "jullie")
+    return pd.Series([template.format(company=c) for c in company], index=df.index, dtype=object)
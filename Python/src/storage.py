@@ -1 +1,52 @@
+from __future__ import annotations
 
+import csv
+import os
+from typing import Dict
+
+import pandas as pd
+
+
+SEND_LOG_FIELDS = ("email", "company", "title", "status", "message_id", "error")
+
+
+def load_suppression(path: str) -> frozenset[str]:
+    """Lowercased emails uit de suppression CSV (kolom 'email'); leeg als het bestand er (nog) niet is."""
+    try:
+        # Alleen de email-kolom parsen; strip/lower gebeurt vectorized i.p.v. per rij
+        df = pd.read_csv(path, usecols=["email"], dtype={"email": "string"})
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return frozenset()
+
+    # .str ops laten NA staan; één mask filtert NA en lege waarden (geen aparte dropna-kopie)
+    emails = df["email"].str.strip().str.lower()
+    return frozenset(emails[emails.notna() & emails.ne("")].tolist())
+
+
+# Paden waarvan de map al bestaat en de header al beslist is (één keer per run i.p.v. per record)
+_prepared_send_logs: set[str] = set()
+
+
+def _prepare_send_log(path: str) -> None:
+    """Map aanmaken en header schrijven als het bestand nieuw/leeg (of alleen whitespace) is; één keer per pad."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "a+", newline="", encoding="utf-8") as f:
+        # Nieuw, leeg of alleen whitespace (bv. een losse "\n") => header; any() stopt bij de eerste echte regel
+        f.seek(0)
+        if not any(line.strip() for line in f):
+            f.truncate(0)
+            csv.writer(f).writerow(SEND_LOG_FIELDS)
+
+    _prepared_send_logs.add(path)
+
+
+def append_send_log(path: str, record: Dict[str, str]) -> None:
+    """Schrijf één log-regel direct naar de CSV (header alleen bij een nieuw/leeg bestand)."""
+    if path not in _prepared_send_logs:
+        _prepare_send_log(path)
+
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow([record.get(k, "") for k in SEND_LOG_FIELDS])